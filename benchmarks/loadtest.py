@@ -0,0 +1,236 @@
+import argparse
+import asyncio
+import random
+import threading
+import time
+
+from aiohttp import web
+from discord.ext import commands
+from discord.ext.commands.view import StringView
+from pathlib import Path
+from types import SimpleNamespace
+
+from wordwicce.settings import local
+
+
+FIXTURES = Path(__file__).with_name("fixtures")
+RUNE_QUERIES = [
+    "feoh",
+    "þorn",
+    "thorn",
+    "ᚠ",
+    "éðel",
+    "wynn",
+    "feo",
+    "nope",
+    "",
+    "feoh ur þorn",
+]
+WIKI_QUERIES = [
+    "woden",
+    "thunor",
+    "frige",
+    "wyrd",
+    "yule",
+    "tiw",
+    "missing page",
+    "woden | thunor | yule",
+]
+
+
+class StandInWiki:
+    def __init__(self, latency: float, jitter: float, error_rate: float):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+        self.pages = [
+            path.read_text(encoding="utf-8") for path in FIXTURES.glob("*.html")
+        ]
+
+    async def page(self, request):
+        self.requests += 1
+        await asyncio.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+        if random.random() < self.error_rate:
+            return web.Response(status=503)
+        if "missing" in request.match_info["title"].lower():
+            return web.Response(status=404)
+        return web.Response(text=random.choice(self.pages), content_type="text/html")
+
+    def start(self, port: int) -> str:
+        ready = threading.Event()
+
+        def serve():
+            loop = asyncio.new_event_loop()
+            app = web.Application()
+            app.router.add_get("/{title}", self.page)
+            runner = web.AppRunner(app)
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+            ready.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        ready.wait()
+        return f"http://127.0.0.1:{port}"
+
+
+class LoadMessage:
+    def __init__(self, content=None, **kwargs):
+        self.id = random.getrandbits(63)
+        self.content = content
+        self.kwargs = kwargs
+
+    async def add_reaction(self, emoji):
+        pass
+
+    async def clear_reactions(self):
+        pass
+
+
+class LoadContext(commands.Context):
+    send_latency = 0.0
+
+    async def send(self, content=None, **kwargs):
+        await asyncio.sleep(self.send_latency)
+        self.replies.append(LoadMessage(content, **kwargs))
+        return self.replies[-1]
+
+
+def context(bot, content: str, guilds: int, users: int) -> LoadContext:
+    message = SimpleNamespace(
+        content=content,
+        author=SimpleNamespace(id=random.randrange(users), bot=False),
+        guild=SimpleNamespace(id=random.randrange(guilds)),
+        channel=SimpleNamespace(id=0),
+        _state=None,
+    )
+    view = StringView(content)
+    ctx = LoadContext(prefix="w!", view=view, bot=bot, message=message)
+    view.skip_string("w!")
+    ctx.invoked_with = view.get_word()
+    ctx.command = bot.all_commands.get(ctx.invoked_with)
+    ctx.replies = []
+    return ctx
+
+
+def invocation(mix: dict) -> tuple:
+    command = random.choices(list(mix), weights=list(mix.values()))[0]
+    if command == "rune":
+        return command, f"w!rune {random.choice(RUNE_QUERIES)}".strip()
+    if command == "wiki":
+        return command, f"w!wiki {random.choice(WIKI_QUERIES)}"
+    return command, f"w!{command}"
+
+
+async def watch_loop(lags: list, interval: float, stop: asyncio.Event):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+def percentiles(values: list) -> str:
+    if not values:
+        return "n=0"
+    values = sorted(values)
+
+    def pick(q):
+        return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+    return (
+        f"n={len(values)} p50={pick(0.5):.1f}ms p95={pick(0.95):.1f}ms "
+        f"p99={pick(0.99):.1f}ms max={values[-1] * 1000:.1f}ms"
+    )
+
+
+async def run(args):
+    from wordwicce.bot import WordwicceBot
+
+    bot = WordwicceBot()
+    bot.get_cog("rune commands").warm()
+    failures = []
+
+    async def on_command_error(ctx, exception):
+        failures.append(exception)
+
+    bot.on_command_error = on_command_error
+    LoadContext.send_latency = args.send_latency
+    latencies = {command: [] for command in args.mix}
+    lags = []
+    stop = asyncio.Event()
+    watcher = asyncio.ensure_future(watch_loop(lags, 0.01, stop))
+    queue = asyncio.Queue()
+    for _ in range(args.requests):
+        queue.put_nowait(invocation(args.mix))
+
+    async def worker():
+        while not queue.empty():
+            command, content = queue.get_nowait()
+            ctx = context(bot, content, args.guilds, args.users)
+            started = time.perf_counter()
+            await bot.invoke(ctx)
+            latencies[command].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(args.concurrency)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await watcher
+    for cog in list(bot.cogs):
+        bot.remove_cog(cog)
+    await asyncio.sleep(0.1)
+
+    print(
+        f"{args.requests} invocations in {elapsed:.2f}s "
+        f"({args.requests / elapsed:.1f}/s) at concurrency {args.concurrency}"
+    )
+    for command, values in latencies.items():
+        print(f"  {command:8} {percentiles(values)}")
+    print(f"  loop lag {percentiles(lags)}")
+    print(f"  failures {len(failures)}")
+    for exception in failures[:5]:
+        print(f"    {type(exception).__name__}: {exception}")
+
+
+def parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        command, _, weight = part.partition("=")
+        mix[command.strip()] = float(weight or 1)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="drive the cogs under load")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=parse_mix("rune=5,runes=1,wiki=4")
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--guilds", type=int, default=100)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.1, help="wiki latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.03)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--send-latency", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    wiki = StandInWiki(args.latency, args.jitter, args.error_rate)
+    local.WIKI_BASE_URL = wiki.start(args.port)
+    local.WIKI_BACKEND = "html"
+    local.WIKI_STORE_PATH = None
+    local.WIKI_INDEX_PATH = None
+    local.WIKI_TITLE_MATCHING = False
+    local.METRICS_PORT = None
+    local.RUNE_PAGE_TIMEOUT = 0.01
+    if args.no_cache:
+        local.WIKI_CACHE_SIZE = 0
+    asyncio.get_event_loop().run_until_complete(run(args))
+    print(f"  upstream wiki requests {wiki.requests}")
+
+
+if __name__ == "__main__":
+    main()
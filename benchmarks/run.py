@@ -0,0 +1,245 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+
+from wordwicce.data.rune import RuneDatabase
+from wordwicce.data.wiki import Wiki, WikiExcerpt
+
+
+FIXTURES = Path(__file__).with_name("fixtures")
+BASELINE = Path(__file__).with_name("baseline.json")
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+class FixtureContent:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_chunked(self, size: int):
+        self.chunks = iter(
+            [self.body[i : i + size] for i in range(0, len(self.body), size)]
+        )
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FixtureResponse:
+    charset = "utf-8"
+
+    def __init__(self, body: bytes):
+        self.content = FixtureContent(body)
+
+
+def cycle(items):
+    i = 0
+    n = len(items)
+
+    def next_item():
+        nonlocal i
+        i += 1
+        return items[i % n]
+
+    return next_item
+
+
+@benchmark("rune.construct")
+def rune_construct():
+    return lambda: RuneDatabase.construct().index
+
+
+@benchmark("rune.search.hit")
+def rune_search_hit():
+    db = RuneDatabase.construct()
+    query = cycle([rune.transliteration for rune in db.runes])
+    return lambda: db.search(query())
+
+
+@benchmark("rune.search.miss")
+def rune_search_miss():
+    db = RuneDatabase.construct()
+    query = cycle(["wodan", "xyzzy", "futhark", "elhaz", "sowilo", "q"])
+    return lambda: db.search(query())
+
+
+@benchmark("rune.search.accented")
+def rune_search_accented():
+    db = RuneDatabase.construct()
+    query = cycle(["ÉÐEL", "Þorn", "hǣgl", "Íor", "gēar", "ᚠ", "peorþ", "ĊĒN"])
+    return lambda: db.search(query())
+
+
+@benchmark("rune.suggest")
+def rune_suggest():
+    db = RuneDatabase.construct()
+    query = cycle(["feo", "thurs", "wyyn", "sigl", "dorn", "eolx"])
+    return lambda: db.suggest(query())
+
+
+@benchmark("rune.embed")
+def rune_embed():
+    db = RuneDatabase.construct()
+    rune = cycle(db.runes)
+
+    def build():
+        r = rune()
+        r._embed = None
+        return r.embed
+
+    return build
+
+
+@benchmark("rune.transliterate")
+def rune_transliterate():
+    db = RuneDatabase.construct()
+    text = "Hwæt! wē Gār-Dena in ġeārdagum þēodcyninga þrym ġefrūnon " * 20
+    db.transliterator
+    return lambda: db.transliterator.transliterate(text)
+
+
+@benchmark("wiki.embed")
+def wiki_embed():
+    excerpt = WikiExcerpt(
+        "Woden",
+        "Woden is the chief god of the Anglo-Saxon pantheon." * 4,
+        "https://anglosaxonheathenry.wiki/Woden",
+        "https://anglosaxonheathenry.wiki/images/Woden.jpg",
+    )
+    return excerpt.to_embed
+
+
+def wiki_parse(fixture: Path):
+    wiki = Wiki()
+    html = fixture.read_text(encoding="utf-8")
+    return lambda: wiki.parse(html)
+
+
+def wiki_stream(fixture: Path):
+    wiki = Wiki()
+    body = fixture.read_bytes()
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(wiki.stream(FixtureResponse(body)))
+
+
+for fixture in sorted(FIXTURES.glob("*.html")):
+    benchmark(f"wiki.parse.{fixture.stem}")(lambda fixture=fixture: wiki_parse(fixture))
+    benchmark(f"wiki.stream.{fixture.stem}")(
+        lambda fixture=fixture: wiki_stream(fixture)
+    )
+
+
+def measure(run, min_time: float = 0.2, repeats: int = 5) -> float:
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            run()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / repeats:
+            break
+        iterations *= 2
+    best = elapsed
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            run()
+        best = min(best, time.perf_counter() - started)
+    return iterations / best
+
+
+def allocations(run, iterations: int = 20) -> tuple:
+    tracemalloc.start()
+    try:
+        run()
+        peak = 0
+        blocks = 0
+        for _ in range(iterations):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            run()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+            blocks += sum(
+                stat.count_diff
+                for stat in tracemalloc.take_snapshot().compare_to(before, "filename")
+                if stat.count_diff > 0
+            )
+    finally:
+        tracemalloc.stop()
+    return peak, blocks / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="run the offline benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="only run matching names")
+    parser.add_argument("--save", action="store_true", help="save a new baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fail when throughput drops by more than this fraction",
+    )
+    parser.add_argument("--no-allocations", action="store_true")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline.exists() and not args.save:
+        baseline = json.loads(args.baseline.read_text())
+
+    results = {}
+    regressions = []
+    print(
+        f"{'benchmark':36} {'ops/s':>12} {'µs/op':>10} {'peak KiB':>9} "
+        f"{'blocks':>8} {'vs base':>8}"
+    )
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        run = setup()
+        ops = measure(run)
+        peak, blocks = (0, 0) if args.no_allocations else allocations(run)
+        results[name] = {"ops": ops, "peak": peak, "allocations": blocks}
+        change = ""
+        if name in baseline:
+            ratio = ops / baseline[name]["ops"]
+            change = f"{(ratio - 1) * 100:+.1f}%"
+            if ratio < 1 - args.threshold:
+                regressions.append(name)
+        print(
+            f"{name:36} {ops:12.1f} {1e6 / ops:10.2f} {peak / 1024:9.1f} "
+            f"{blocks:8.1f} {change:>8}"
+        )
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Saved baseline to {args.baseline}.")
+    elif not baseline:
+        print("No baseline to compare against; run with --save to record one.")
+    if regressions:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from wordwicce.data.index import main
+
+
+main()
@@ -0,0 +1,4 @@
+from wordwicce.data.dictionary import main
+
+
+main()
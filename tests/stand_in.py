@@ -0,0 +1,19 @@
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+
+FIXTURES = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+
+
+@asynccontextmanager
+async def stand_in(*routes):
+    app = web.Application()
+    app.add_routes(routes)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("/")).rstrip("/")
+    finally:
+        await server.close()
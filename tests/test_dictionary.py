@@ -0,0 +1,40 @@
+import json
+
+from wordwicce.data.dictionary import PARADIGMS, Dictionary
+
+
+ENTRIES = [
+    {"headword": "stān", "definition": "a stone"},
+    {"headword": "cyning", "definition": "a king"},
+    {"headword": "lufian", "definition": "to love"},
+]
+
+
+def dictionary(tmp_path) -> Dictionary:
+    path = str(tmp_path / "bt.sqlite3")
+    writer = Dictionary(path, readonly=False)
+    writer.add(ENTRIES)
+    with open(PARADIGMS, encoding="utf-8") as f:
+        writer.add_forms(json.load(f))
+    writer.close()
+    return Dictionary(path)
+
+
+def headwords(entries) -> list:
+    return [entry.headword for entry in entries]
+
+
+def test_inflected_forms_find_their_headword(tmp_path):
+    bt = dictionary(tmp_path)
+    assert headwords(bt.lookup("stānes")) == ["stān"]
+    assert headwords(bt.lookup("stanas")) == ["stān"]
+    assert headwords(bt.lookup("cyninges")) == ["cyning"]
+    assert headwords(bt.lookup("lufode")) == ["lufian"]
+    bt.close()
+
+
+def test_queries_that_fold_to_nothing_find_nothing(tmp_path):
+    bt = dictionary(tmp_path)
+    assert bt.lookup("-") == []
+    assert bt.lookup("  ") == []
+    bt.close()
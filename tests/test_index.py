@@ -0,0 +1,150 @@
+import asyncio
+
+from aiohttp import web
+
+from wordwicce.data.index import TitleIndex, WikiCrawler, WikiIndex, build_index
+from wordwicce.data.wiki import Wiki
+
+from .stand_in import FIXTURES, stand_in
+
+
+PAGES = {
+    "Woden": "woden.html",
+    "Anglo-Saxon_Heathenry": "anglo-saxon_heathenry.html",
+    "Wyrd": "stub.html",
+}
+
+
+class StandInWiki:
+    def __init__(self):
+        self.pages = dict(PAGES)
+        self.changed = []
+        self.failing = set()
+
+    async def api(self, request):
+        if request.query["list"] == "allpages":
+            titles = [title.replace("_", " ") for title in PAGES]
+            if "apcontinue" in request.query:
+                items, more = titles[2:], {}
+            else:
+                items, more = titles[:2], {"continue": {"apcontinue": titles[2]}}
+        else:
+            items, more = self.changed, {}
+        return web.json_response(
+            {"query": {request.query["list"]: [{"title": t} for t in items]}, **more}
+        )
+
+    async def page(self, request):
+        if request.match_info["title"] in self.failing:
+            return web.Response(status=503)
+        fixture = self.pages.get(request.match_info["title"])
+        if fixture is None:
+            return web.Response(status=404)
+        return web.FileResponse(FIXTURES / fixture)
+
+    def routes(self):
+        return web.get("/api.php", self.api), web.get("/{title}", self.page)
+
+
+async def crawl(path, changes=None):
+    wiki = StandInWiki()
+    async with stand_in(*wiki.routes()) as base_url:
+        crawler = WikiCrawler(Wiki(base_url=base_url), WikiIndex(path), 2)
+        try:
+            built = await crawler.build()
+            if changes is not None:
+                changes(wiki)
+                refreshed = await crawler.refresh()
+            else:
+                refreshed = None
+            return built, refreshed, crawler
+        finally:
+            await crawler.wiki.close()
+            crawler.index.close()
+
+
+def test_build_crawls_every_page(tmp_path):
+    built, _, crawler = asyncio.run(crawl(tmp_path / "index.sqlite3"))
+    pages = crawler.index.pages
+    assert built == 3
+    assert sorted(excerpt.title for excerpt in pages.values()) == [
+        "Anglo-Saxon Heathenry",
+        "Woden",
+        "Wyrd",
+    ]
+    assert pages["woden"].picture.endswith("Woden.jpg")
+    index = WikiIndex(tmp_path / "index.sqlite3")
+    assert len(index) == 3
+    assert index.refreshed_at is not None
+    index.close()
+
+
+def test_refresh_updates_only_changed_pages(tmp_path):
+    def changes(wiki):
+        del wiki.pages["Woden"]
+        wiki.changed = ["Woden"]
+
+    _, refreshed, crawler = asyncio.run(crawl(tmp_path / "index.sqlite3", changes))
+    pages = crawler.index.pages
+    assert refreshed == 1
+    assert "woden" not in pages
+    assert "wyrd" in pages
+
+
+def test_failed_pages_hold_back_the_watermark(tmp_path):
+    path = tmp_path / "index.sqlite3"
+
+    def changes(wiki):
+        wiki.changed = ["Woden", "Wyrd"]
+        wiki.failing = {"Woden"}
+        index = WikiIndex(path)
+        index.refreshed_at = "2000-01-01T00:00:00Z"
+        index.commit()
+        index.close()
+
+    _, refreshed, crawler = asyncio.run(crawl(path, changes))
+    assert refreshed == 2
+    assert crawler.failed == {"Woden"}
+    assert "woden" in crawler.index.pages
+    index = WikiIndex(path)
+    assert index.refreshed_at == "2000-01-01T00:00:00Z"
+    index.close()
+
+
+def test_refresh_with_nothing_changed(tmp_path, capsys):
+    path = str(tmp_path / "index.sqlite3")
+
+    async def run():
+        async with stand_in(*StandInWiki().routes()) as base_url:
+            await build_index(path, base_url, 2, refresh=False)
+            await build_index(path, base_url, 2, refresh=True)
+
+    asyncio.run(run())
+    assert capsys.readouterr().out.splitlines() == [
+        f"Crawled 3 pages, 3 in {path}.",
+        f"Crawled 0 pages, 3 in {path}.",
+    ]
+
+
+TITLES = [
+    "Woden",
+    "Wōdnesdæg",
+    "The Nine Herbs Charm",
+    "The Wild Hunt",
+    "Anglo-Saxon Heathenry",
+    "Anglo-Saxon Runes",
+    "Yule",
+]
+
+
+def test_titles_prefer_close_matches_over_prefixes():
+    titles = TitleIndex(TITLES)
+    assert titles.resolve("wodne") == "Woden"
+    assert titles.resolve("yul") == "Yule"
+
+
+def test_titles_ignore_ambiguous_prefixes():
+    titles = TitleIndex(TITLES)
+    assert titles.resolve("the") is None
+    assert titles.resolve("anglo") is None
+    assert titles.suggest("anglo") == ["Anglo-Saxon Heathenry", "Anglo-Saxon Runes"]
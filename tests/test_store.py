@@ -0,0 +1,16 @@
+from wordwicce.data.store import WikiStore
+from wordwicce.data.wiki import WikiExcerpt
+
+
+def test_reads_only_write_when_the_access_time_is_old(tmp_path):
+    store = WikiStore(str(tmp_path / "wiki.sqlite3"), access_interval=60)
+    store.put("Woden", WikiExcerpt("Woden", "the chief god", "https://w/Woden"))
+    changes = store.db.total_changes
+    assert store.get("Woden").excerpt.title == "Woden"
+    assert store.db.total_changes == changes
+    store.db.execute("UPDATE excerpts SET accessed_at = 0")
+    store.db.commit()
+    changes = store.db.total_changes
+    store.get("Woden")
+    assert store.db.total_changes == changes + 1
+    store.close()
@@ -0,0 +1,25 @@
+import asyncio
+
+from aiohttp import web
+
+from wordwicce.data.wiki import Wiki
+
+from .stand_in import FIXTURES, stand_in
+
+
+async def search(body: bytes, content_type: str):
+    async def page(request):
+        return web.Response(body=body, headers={"Content-Type": content_type})
+
+    async with stand_in(web.get("/{title}", page)) as base_url:
+        wiki = Wiki(base_url=base_url)
+        try:
+            return await wiki.search("woden")
+        finally:
+            await wiki.close()
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    body = (FIXTURES / "woden.html").read_bytes()
+    excerpt = asyncio.run(search(body, "text/html; charset=x-no-such-codec"))
+    assert excerpt.title == "Woden"
@@ -0,0 +1,79 @@
+import asyncio
+
+from aiohttp import web
+
+from wordwicce.data.wiki import WikiAPI
+
+from .stand_in import stand_in
+
+
+WODEN = {
+    "title": "Wōden",
+    "extract": "Woden is the chief god of the Anglo-Saxon pantheon.",
+    "fullurl": "https://anglosaxonheathenry.wiki/W%C5%8Dden",
+    "original": {"source": "https://anglosaxonheathenry.wiki/images/Woden.jpg"},
+}
+WYRD = {
+    "title": "Wyrd",
+    "extract": "Wyrd is fate.",
+    "fullurl": "https://anglosaxonheathenry.wiki/Wyrd",
+}
+
+
+def query(requests: list, answer):
+    async def api(request):
+        requests.append(dict(request.query))
+        return web.json_response({"query": answer(request.query["titles"])})
+
+    return web.get("/api.php", api)
+
+
+async def search(answer, term: str):
+    requests = []
+    async with stand_in(query(requests, answer)) as base_url:
+        wiki = WikiAPI(base_url=base_url)
+        try:
+            return await wiki.search(term), requests
+        finally:
+            await wiki.close()
+
+
+def test_candidates_are_batched_into_one_request():
+    excerpt, requests = asyncio.run(
+        search(lambda titles: {"pages": [dict(WYRD)]}, "wyrd")
+    )
+    assert len(requests) == 1
+    assert requests[0]["titles"].split("|") == ["wyrd", "Wyrd"]
+    assert requests[0]["redirects"] == "1"
+    assert excerpt.title == "Wyrd"
+
+
+def test_follows_normalized_then_redirected_titles():
+    def answer(titles):
+        return {
+            "normalized": [{"from": "woden", "to": "Woden"}],
+            "redirects": [{"from": "Woden", "to": "Wōden"}],
+            "pages": [dict(WODEN)],
+        }
+
+    excerpt, _ = asyncio.run(search(answer, "woden"))
+    assert excerpt.title == "Wōden"
+    assert excerpt.text == WODEN["extract"]
+    assert excerpt.url == WODEN["fullurl"]
+
+
+def test_missing_pages_are_not_found():
+    def answer(titles):
+        return {
+            "pages": [{"title": title, "missing": True} for title in titles.split("|")]
+        }
+
+    excerpt, _ = asyncio.run(search(answer, "nothing here"))
+    assert excerpt is None
+
+
+def test_page_image_becomes_the_picture():
+    excerpt, _ = asyncio.run(search(lambda titles: {"pages": [dict(WODEN)]}, "Wōden"))
+    assert excerpt.picture == WODEN["original"]["source"]
+    excerpt, _ = asyncio.run(search(lambda titles: {"pages": [dict(WYRD)]}, "wyrd"))
+    assert excerpt.picture is None
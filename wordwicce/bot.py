@@ -1,27 +1,94 @@
+import asyncio
+import time
+
+from discord import Intents, MemberCacheFlags
 from discord.ext import commands
 
-from .cogs.misc import MiscCog
-from .cogs.rune import RuneCog
-from .cogs.wiki import WikiCog
+from .cluster import Launcher, recommended_shards
+from .metrics import metrics
 from .settings import local
 
 
-class WordwicceBot(commands.Bot):
-    def __init__(self, **kwargs):
+class WordwicceBot(commands.AutoShardedBot):
+    def __init__(self, cluster: int = 0, **kwargs):
+        if local.LEAN_GATEWAY:
+            kwargs.setdefault("intents", Intents(**local.LEAN_INTENTS))
+            kwargs.setdefault("member_cache_flags", MemberCacheFlags.none())
+            kwargs.setdefault("chunk_guilds_at_startup", False)
+            kwargs.setdefault("max_messages", None)
         super().__init__("w!", **kwargs)
-        self.add_cog(MiscCog(self))
-        self.add_cog(RuneCog(self))
-        self.add_cog(WikiCog(self))
+        self.cluster = cluster
+        self.load_times = {}
+        for name in local.EXTENSIONS:
+            self.load_extension(name)
+        self.before_invoke(self.start_timer)
+        self.after_invoke(self.stop_timer)
+
+    @staticmethod
+    def extension_name(name: str) -> str:
+        return name if "." in name else f"wordwicce.cogs.{name}"
+
+    def load_extension(self, name: str):
+        name = self.extension_name(name)
+        started = time.perf_counter()
+        super().load_extension(name)
+        elapsed = self.load_times[name] = time.perf_counter() - started
+        metrics.observe(f"extension.{name.rpartition('.')[2]}", elapsed)
+        return elapsed
+
+    def reload_extension(self, name: str):
+        name = self.extension_name(name)
+        super().reload_extension(name)
+        return self.load_times[name]
+
+    def unload_extension(self, name: str):
+        name = self.extension_name(name)
+        super().unload_extension(name)
+        self.load_times.pop(name, None)
+
+    async def start_timer(self, ctx):
+        ctx.started_at = time.perf_counter()
+
+    async def stop_timer(self, ctx):
+        name = ctx.command.qualified_name
+        metrics.observe(f"command.{name}", time.perf_counter() - ctx.started_at)
+        metrics.increment(f"command.{name}.calls")
+
+    @property
+    def primary(self) -> bool:
+        return self.cluster == 0
 
     async def on_ready(self):
-        print(f"Logged in as {self.user} on {len(self.guilds)} servers!")
+        print(
+            f"Logged in as {self.user} on {len(self.guilds)} servers "
+            f"with shards {sorted(self.shards)} of {self.shard_count}!"
+        )
 
     async def on_command_error(self, ctx, exception):
         if isinstance(exception, commands.errors.CommandNotFound):
             return
+        metrics.increment(f"command.{ctx.command.qualified_name}.errors")
         return await super().on_command_error(ctx, exception)
 
 
-def run():
-    bot = WordwicceBot()
+def run_cluster(cluster: int, shard_ids: list | None, shard_count: int | None):
+    bot = WordwicceBot(cluster=cluster, shard_ids=shard_ids, shard_count=shard_count)
     bot.run(local.DISCORD_TOKEN)
+
+
+def run():
+    if not local.CLUSTER_SIZE:
+        return run_cluster(0, None, local.SHARD_COUNT)
+    shard_count = local.SHARD_COUNT
+    if shard_count is None:
+        loop = asyncio.new_event_loop()
+        try:
+            shard_count = loop.run_until_complete(
+                recommended_shards(local.DISCORD_TOKEN)
+            )
+        finally:
+            loop.close()
+    launcher = Launcher(
+        run_cluster, shard_count, local.CLUSTER_SIZE, stagger=local.CLUSTER_STAGGER
+    )
+    launcher.run()
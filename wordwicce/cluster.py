@@ -0,0 +1,71 @@
+import multiprocessing
+import time
+
+from discord.http import HTTPClient
+from multiprocessing.connection import wait
+
+
+async def recommended_shards(token: str) -> int:
+    http = HTTPClient()
+    try:
+        await http.static_login(token, bot=True)
+        shards, _ = await http.get_bot_gateway()
+    finally:
+        await http.close()
+    return shards
+
+
+def shard_ranges(shard_count: int, cluster_size: int) -> list:
+    return [
+        list(range(first, min(first + cluster_size, shard_count)))
+        for first in range(0, shard_count, cluster_size)
+    ]
+
+
+class Launcher:
+    def __init__(
+        self,
+        target,
+        shard_count: int,
+        cluster_size: int,
+        stagger: float = 5.0,
+        restart_delay: float = 5.0,
+    ):
+        self.target = target
+        self.shard_count = shard_count
+        self.clusters = shard_ranges(shard_count, cluster_size)
+        self.stagger = stagger
+        self.restart_delay = restart_delay
+        self.context = multiprocessing.get_context("spawn")
+        self.processes = {}
+
+    def start(self, cluster: int):
+        process = self.context.Process(
+            target=self.target,
+            args=(cluster, self.clusters[cluster], self.shard_count),
+            name=f"wordwicce-cluster-{cluster}",
+        )
+        process.start()
+        self.processes[process.sentinel] = (cluster, process)
+        print(f"Started cluster {cluster} with shards {self.clusters[cluster]}.")
+
+    def run(self):
+        try:
+            for cluster, shard_ids in enumerate(self.clusters):
+                if cluster:
+                    time.sleep(self.stagger * len(self.clusters[cluster - 1]))
+                self.start(cluster)
+            while self.processes:
+                for sentinel in wait(list(self.processes)):
+                    cluster, process = self.processes.pop(sentinel)
+                    process.join()
+                    if process.exitcode == 0:
+                        continue
+                    print(f"Cluster {cluster} exited with {process.exitcode}.")
+                    time.sleep(self.restart_delay)
+                    self.start(cluster)
+        finally:
+            for _, process in self.processes.values():
+                process.terminate()
+            for _, process in self.processes.values():
+                process.join()
@@ -0,0 +1,44 @@
+from discord.ext import commands
+
+
+class AdminCog(commands.Cog, name="administration"):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_check(self, ctx):
+        return await self.bot.is_owner(ctx.author)
+
+    async def change(self, ctx, change, name: str, verb: str):
+        try:
+            elapsed = change(name)
+        except commands.ExtensionError as e:
+            return await ctx.send(f"couldn't {verb} {name}: {e}")
+        if elapsed is None:
+            return await ctx.send(f"{verb}ed {name}.")
+        return await ctx.send(f"{verb}ed {name} in {elapsed * 1000:.1f}ms.")
+
+    @commands.command(description="loads an extension")
+    async def load(self, ctx, name: str):
+        return await self.change(ctx, self.bot.load_extension, name, "load")
+
+    @commands.command(description="unloads an extension")
+    async def unload(self, ctx, name: str):
+        return await self.change(ctx, self.bot.unload_extension, name, "unload")
+
+    @commands.command(description="reloads an extension")
+    async def reload(self, ctx, name: str):
+        return await self.change(ctx, self.bot.reload_extension, name, "reload")
+
+    @commands.command(description="lists loaded extensions and their load times")
+    async def extensions(self, ctx):
+        return await ctx.send(
+            "\n".join(
+                f"{name}: {elapsed * 1000:.1f}ms"
+                for name, elapsed in sorted(self.bot.load_times.items())
+            )
+            or "no extensions are loaded."
+        )
+
+
+def setup(bot):
+    bot.add_cog(AdminCog(bot))
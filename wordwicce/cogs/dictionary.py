@@ -1,10 +1,43 @@
+import sqlite3
+
 from discord.ext import commands
 
+from ..data.dictionary import Dictionary
+from ..settings import local
+
 
-class DictionaryCog(commands.Cog):
+class DictionaryCog(commands.Cog, name="dictionary commands"):
     def __init__(self, bot):
         self.bot = bot
+        self.data = None
+
+    def cog_unload(self):
+        if self.data is not None:
+            self.data.close()
+
+    @commands.command(description="looks a word up in Bosworth-Toller")
+    async def bt(self, ctx, *, query: str = None):
+        if not query:
+            return await ctx.send("you need to tell me what word you're looking for!")
+        if self.data is None:
+            try:
+                self.data = Dictionary(local.DICTIONARY_PATH)
+            except sqlite3.OperationalError:
+                return await ctx.send(
+                    "sorry, the dictionary isn't available right now."
+                )
+        entries = self.data.lookup(query)
+        if not entries:
+            return await ctx.send("sorry, I couldn't find that in the dictionary.")
+        if len(entries) == 1:
+            return await ctx.send(embed=entries[0].to_embed())
+        return await ctx.send(
+            "\n".join(
+                f"• **{entry.headword}** · {entry.definition[:120]}"
+                for entry in entries
+            )
+        )
+
 
-    @commands.command()
-    async def bt(self, ctx, query):
-        pass
+def setup(bot):
+    bot.add_cog(DictionaryCog(bot))
@@ -16,3 +16,7 @@ class MiscCog(commands.Cog, name="miscellaneous"):
     @commands.command()
     async def wyrd(self, ctx):
         await ctx.send("> **gǽð á wyrd swá hío sceal**\n> wyrd goes ever as she must")
+
+
+def setup(bot):
+    bot.add_cog(MiscCog(bot))
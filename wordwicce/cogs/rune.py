@@ -1,12 +1,37 @@
+import asyncio
+
+from discord import Forbidden, HTTPException, Object
 from discord.ext import commands
 
+from ..data.embeds import combine
 from ..data.rune import Rune, RuneDatabase
+from ..metrics import metrics
+from ..settings import local
 
 
 class RuneCog(commands.Cog, name="rune commands"):
     def __init__(self, bot):
         self.bot = bot
-        self.db = RuneDatabase.construct()
+        self.db = RuneDatabase.construct(
+            rows=local.RUNE_ROWS, page_size=local.RUNE_PAGE_SIZE
+        )
+        self.navigators = set()
+        self.warmed = False
+        if local.RUNE_WARM_UP and bot.is_ready():
+            self.warm()
+
+    def cog_unload(self):
+        for task in self.navigators:
+            task.cancel()
+
+    def warm(self):
+        metrics.observe("rune.warm", self.db.warm())
+        self.warmed = True
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if local.RUNE_WARM_UP and not self.warmed:
+            self.warm()
 
     @commands.command(description="returns information on a rune")
     async def rune(self, ctx, *, query: str = None):
@@ -14,11 +39,112 @@ class RuneCog(commands.Cog, name="rune commands"):
             rune = self.db.random()
             return await ctx.send(embed=rune.embed)
         rune = self.db.search(query)
-        if not rune:
-            return await ctx.send("sorry, I couldn't find that rune.")
-        else:
+        if rune:
             return await ctx.send(embed=rune.embed)
+        queries = list(dict.fromkeys(query.replace("|", " ").split()))
+        if len(queries) > 1:
+            return await self.batch(ctx, queries)
+        suggestions = self.db.suggest(query, local.RUNE_MAX_DISTANCE)
+        if not suggestions:
+            return await ctx.send("sorry, I couldn't find that rune.")
+        message = "sorry, I couldn't find that rune. did you mean {0}?".format(
+            " or ".join(
+                f"**{rune.transliteration}** ({rune.symbol})" for rune in suggestions
+            )
+        )
+        if len(suggestions) == 1:
+            return await ctx.send(message, embed=suggestions[0].embed)
+        return await ctx.send(message)
+
+    async def batch(self, ctx, queries: list):
+        if len(queries) > local.RUNE_BATCH_SIZE:
+            return await ctx.send(
+                f"sorry, I can only look up {local.RUNE_BATCH_SIZE} runes at once."
+            )
+        found, missing = [], []
+        for query in queries:
+            rune = self.db.search(query)
+            if rune is None:
+                missing.append(query)
+            elif rune not in found:
+                found.append(rune)
+        if not found:
+            return await ctx.send("sorry, I couldn't find any of those runes.")
+        message = None
+        if missing:
+            message = "sorry, I couldn't find {0}.".format(
+                ", ".join(f"**{query}**" for query in missing)
+            )
+        embeds = combine([rune.embed for rune in found])
+        await ctx.send(message, embed=embeds[0])
+        for embed in embeds[1:]:
+            await ctx.send(embed=embed)
 
     @commands.command(description="returns a list of runes")
-    async def runes(self, ctx):
-        return await ctx.send(self.db.discord_string)
+    async def runes(self, ctx, page: int = 1):
+        pages = self.db.pages
+        page = min(max(page, 1), len(pages)) - 1
+        message = await ctx.send(pages[page])
+        if len(pages) > 1:
+            task = self.bot.loop.create_task(self.navigate(ctx, message, page))
+            self.navigators.add(task)
+            task.add_done_callback(self.navigators.discard)
+
+    async def navigate(self, ctx, message, page: int):
+        pages = self.db.pages
+        moves = {local.RUNE_PAGE_BACK: -1, local.RUNE_PAGE_NEXT: 1}
+        try:
+            for emoji in moves:
+                await message.add_reaction(emoji)
+            while True:
+                payload = await self.bot.wait_for(
+                    "raw_reaction_add",
+                    timeout=local.RUNE_PAGE_TIMEOUT,
+                    check=lambda payload: payload.message_id == message.id
+                    and payload.user_id == ctx.author.id
+                    and str(payload.emoji) in moves,
+                )
+                page = (page + moves[str(payload.emoji)]) % len(pages)
+                await message.edit(content=pages[page])
+                try:
+                    await message.remove_reaction(
+                        payload.emoji, Object(id=payload.user_id)
+                    )
+                except Forbidden:
+                    pass
+        except asyncio.TimeoutError:
+            try:
+                await message.clear_reactions()
+            except Forbidden:
+                pass
+        except HTTPException:
+            pass
+
+    @commands.command(description="writes text in futhorc runes")
+    async def transliterate(self, ctx, *, text: str = None):
+        if not text:
+            return await ctx.send("you need to give me something to write!")
+        runes = self.db.transliterator.transliterate(text)
+        if len(runes) > 2000:
+            return await ctx.send("sorry, that's too long for me to write out.")
+        return await ctx.send(runes)
+
+    @commands.command(description="reads futhorc runes back into letters")
+    async def decode(self, ctx, *, text: str = None):
+        if not text:
+            return await ctx.send("you need to give me some runes to read!")
+        meanings = text.startswith(("-m ", "--meanings "))
+        if meanings:
+            text = text.split(maxsplit=1)[1]
+            message = "\n".join(self.db.decoder.annotate(text))
+        else:
+            message = self.db.decoder.decode(text)
+        if not message.strip():
+            return await ctx.send("sorry, I couldn't find any runes in that.")
+        if len(message) > 2000:
+            return await ctx.send("sorry, that's too long for me to read out.")
+        return await ctx.send(message)
+
+
+def setup(bot):
+    bot.add_cog(RuneCog(bot))
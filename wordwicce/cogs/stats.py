@@ -0,0 +1,54 @@
+from discord.ext import commands
+
+from ..metrics import metrics, resident_memory
+from ..settings import local
+
+
+class StatsCog(commands.Cog, name="statistics"):
+    def __init__(self, bot):
+        self.bot = bot
+        self.runner = None
+        metrics.gauge("process", self.memory)
+        if local.METRICS_PORT:
+            bot.loop.create_task(
+                self.serve(local.METRICS_HOST, local.METRICS_PORT + bot.cluster)
+            )
+
+    def cog_unload(self):
+        if self.runner is not None:
+            self.bot.loop.create_task(self.runner.cleanup())
+
+    def memory(self) -> dict:
+        rss = resident_memory()
+        guilds = len(self.bot.guilds)
+        return {
+            "rss_bytes": rss,
+            "guilds": guilds,
+            "rss_per_guild_bytes": rss // guilds if guilds else 0,
+        }
+
+    async def serve(self, host: str, port: int):
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/metrics", self.render)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+
+    async def render(self, request):
+        from aiohttp import web
+
+        return web.Response(text=metrics.render())
+
+    @commands.command(description="shows latency and error statistics")
+    @commands.is_owner()
+    async def stats(self, ctx):
+        summary = metrics.summary() or "nothing to report yet."
+        if len(summary) > 1990:
+            summary = summary[:1989] + "…"
+        return await ctx.send(f"```\n{summary}\n```")
+
+
+def setup(bot):
+    bot.add_cog(StatsCog(bot))
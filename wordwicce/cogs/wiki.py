@@ -1,19 +1,207 @@
-from discord import Embed
-from discord.ext import commands
+import asyncio
 
-from ..data.wiki import Wiki
+from discord.ext import commands, tasks
+from math import ceil
+
+from ..data.cache import TTLCache
+from ..data.embeds import combine
+from ..data.index import TitleIndex, WikiCrawler, WikiIndex
+from ..data.limits import CircuitBreaker, Cooldown, Limiter
+from ..data.store import WikiStore
+from ..data.wiki import Wiki, WikiAPI, WikiBusy, WikiError
+from ..metrics import metrics
+from ..settings import local
 
 
 class WikiCog(commands.Cog, name="wiki commands"):
+    BACKENDS = {"html": Wiki, "api": WikiAPI}
+
     def __init__(self, bot):
         self.bot = bot
-        self.data = Wiki()
+        self.data = self.BACKENDS[local.WIKI_BACKEND](
+            base_url=local.WIKI_BASE_URL,
+            connect_timeout=local.WIKI_CONNECT_TIMEOUT,
+            read_timeout=local.WIKI_READ_TIMEOUT,
+            pool_size=local.WIKI_POOL_SIZE,
+            cache=TTLCache(
+                maxsize=local.WIKI_CACHE_SIZE,
+                ttl=local.WIKI_CACHE_TTL,
+                negative_ttl=local.WIKI_CACHE_NEGATIVE_TTL,
+            ),
+            limiter=Limiter(
+                concurrency=local.WIKI_CONCURRENCY,
+                max_pending=local.WIKI_MAX_PENDING,
+            ),
+            breaker=CircuitBreaker(
+                threshold=local.WIKI_BREAKER_THRESHOLD,
+                reset_timeout=local.WIKI_BREAKER_RESET,
+            ),
+        )
+        self.guild_cooldown = (
+            Cooldown(*local.WIKI_GUILD_COOLDOWN) if local.WIKI_GUILD_COOLDOWN else None
+        )
+        self.user_cooldown = (
+            Cooldown(*local.WIKI_USER_COOLDOWN) if local.WIKI_USER_COOLDOWN else None
+        )
+        metrics.gauge("wiki.cache", self.data.cache.stats)
+        metrics.gauge("wiki.inflight", lambda: len(self.data.inflight))
+        metrics.gauge("wiki.queue", self.data.limiter.stats)
+        metrics.gauge("wiki.breaker", self.data.breaker.stats)
+        if local.WIKI_STORE_PATH:
+            self.data.store = WikiStore(
+                local.WIKI_STORE_PATH,
+                ttl=local.WIKI_STORE_TTL,
+                max_age=local.WIKI_STORE_MAX_AGE,
+                max_entries=local.WIKI_STORE_MAX_ENTRIES,
+                access_interval=local.WIKI_STORE_ACCESS_INTERVAL,
+            )
+            if bot.primary:
+                self.compact_store.start()
+        if local.WIKI_INDEX_PATH:
+            self.data.index = WikiIndex(local.WIKI_INDEX_PATH)
+            self.crawler = WikiCrawler(
+                Wiki(
+                    base_url=local.WIKI_BASE_URL,
+                    connect_timeout=local.WIKI_CONNECT_TIMEOUT,
+                    read_timeout=local.WIKI_READ_TIMEOUT,
+                    pool_size=local.WIKI_INDEX_CONCURRENCY,
+                ),
+                self.data.index,
+                concurrency=local.WIKI_INDEX_CONCURRENCY,
+            )
+            self.refresh_index.start()
+        if local.WIKI_TITLE_MATCHING:
+            self.data.titles = TitleIndex(threshold=local.WIKI_TITLE_THRESHOLD)
+            self.refresh_titles.start()
+
+    def cog_unload(self):
+        self.compact_store.cancel()
+        self.refresh_index.cancel()
+        self.refresh_titles.cancel()
+        self.bot.loop.create_task(self.data.close())
+        if self.data.index is not None:
+            self.bot.loop.create_task(self.crawler.wiki.close())
+
+    @tasks.loop(hours=6)
+    async def compact_store(self):
+        self.data.store.compact()
+
+    @tasks.loop(minutes=30)
+    async def refresh_index(self):
+        if not self.bot.primary:
+            return self.data.index.load()
+        if self.data.index.refreshed_at is None:
+            return
+        try:
+            await self.crawler.refresh()
+        except WikiError:
+            pass
+
+    @tasks.loop(hours=6)
+    async def refresh_titles(self):
+        try:
+            titles = [title async for title in self.data.all_titles()]
+        except WikiError:
+            return
+        self.data.titles.update(titles)
+
+    def cooldown(self, ctx, count: int = 1) -> float:
+        buckets = []
+        if self.user_cooldown is not None:
+            buckets.append((self.user_cooldown, ctx.author.id))
+        if self.guild_cooldown is not None and ctx.guild is not None:
+            buckets.append((self.guild_cooldown, ctx.guild.id))
+        retry_after = max(
+            [cooldown.retry_after(key, count) for cooldown, key in buckets],
+            default=0.0,
+        )
+        if retry_after:
+            return retry_after
+        for cooldown, key in buckets:
+            cooldown.take(key, count)
+        return 0.0
+
+    async def batch(self, ctx, queries: list):
+        semaphore = asyncio.Semaphore(local.WIKI_BATCH_CONCURRENCY)
+
+        async def search(query):
+            async with semaphore:
+                return await self.data.search(query)
+
+        results = await asyncio.gather(
+            *[search(query) for query in queries], return_exceptions=True
+        )
+        found, missing, failed = [], [], []
+        for query, result in zip(queries, results):
+            if isinstance(result, WikiError):
+                failed.append(query)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result is None:
+                missing.append(query)
+            else:
+                found.append(result)
+        lines = []
+        if missing:
+            lines.append(
+                "sorry! i couldn't find {0} on the wiki.".format(
+                    ", ".join(f"**{query}**" for query in missing)
+                )
+            )
+        if failed:
+            lines.append(
+                "sorry! the wiki didn't answer for {0}.".format(
+                    ", ".join(f"**{query}**" for query in failed)
+                )
+            )
+        with metrics.time("wiki.embed"):
+            embeds = combine([excerpt.to_embed() for excerpt in found])
+        if any(excerpt.stale for excerpt in found):
+            embeds[-1].set_footer(text="some of these excerpts may be out of date.")
+        if not embeds:
+            return await ctx.send("\n".join(lines))
+        await ctx.send("\n".join(lines) or None, embed=embeds[0])
+        for embed in embeds[1:]:
+            await ctx.send(embed=embed)
 
     @commands.command(description="returns a short wiki excerpt")
     async def wiki(self, ctx, *, query: str = None):
-        if not query:
+        queries = list(dict.fromkeys(part.strip() for part in (query or "").split("|")))
+        queries = [query for query in queries if query]
+        if not queries:
             return await ctx.send("you need to tell me what you're looking for!")
-        response = self.data.search(query)
+        if len(queries) > local.WIKI_BATCH_SIZE:
+            return await ctx.send(
+                f"sorry! i can only look up {local.WIKI_BATCH_SIZE} things at once."
+            )
+        retry_after = self.cooldown(ctx, len(queries))
+        if retry_after:
+            metrics.increment("wiki.cooldowns")
+            return await ctx.send(
+                f"slow down! try the wiki again in {ceil(retry_after)}s."
+            )
+        if len(queries) > 1:
+            return await self.batch(ctx, queries)
+        query = queries[0]
+        try:
+            response = await self.data.search(query)
+        except WikiBusy:
+            return await ctx.send("sorry! i'm busy with the wiki, try again shortly.")
+        except WikiError:
+            return await ctx.send("sorry! the wiki isn't answering right now.")
         if not response:
+            suggestions = self.data.suggest(query)
+            if suggestions:
+                return await ctx.send(
+                    "sorry! i couldn't find that on the wiki. did you mean {0}?".format(
+                        " or ".join(f"**{title}**" for title in suggestions)
+                    )
+                )
             return await ctx.send("sorry! i couldn't find that on the wiki.")
-        return await ctx.send(embed=response.to_embed())
+        with metrics.time("wiki.embed"):
+            embed = response.to_embed()
+        return await ctx.send(embed=embed)
+
+
+def setup(bot):
+    bot.add_cog(WikiCog(bot))
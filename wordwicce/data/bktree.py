@@ -0,0 +1,50 @@
+def levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y))
+            )
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    def __init__(self, words=(), distance=levenshtein):
+        self.distance = distance
+        self.root = None
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            d = self.distance(word, node[0])
+            if d == 0:
+                return
+            if d not in node[1]:
+                node[1][d] = (word, {})
+                return
+            node = node[1][d]
+
+    def search(self, word: str, max_distance: int) -> list:
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            candidate, children = stack.pop()
+            d = self.distance(word, candidate)
+            if d <= max_distance:
+                found.append((d, candidate))
+            for child_distance, child in children.items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    stack.append(child)
+        found.sort()
+        return found
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from collections import OrderedDict
+
+
+MISSING = object()
+
+
+class TTLCache:
+    def __init__(
+        self, maxsize: int = 1024, ttl: float = 3600, negative_ttl: float = 300
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key, default=MISSING):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value, ttl: float | None = None):
+        if ttl is None:
+            ttl = self.ttl if value is not None else self.negative_ttl
+        self.entries[key] = (time.monotonic() + ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SingleFlight:
+    def __init__(self):
+        self.pending = {}
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    async def do(self, key, factory):
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self.pending[key] = task
+            task.add_done_callback(lambda _: self.pending.pop(key, None))
+        return await asyncio.shield(task)
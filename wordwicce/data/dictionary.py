@@ -0,0 +1,205 @@
+import argparse
+import csv
+import json
+import sqlite3
+
+from discord import Colour, Embed
+from pathlib import Path
+from typing import Iterable, List
+
+from .oe import fold, inflect
+
+
+PARADIGMS = Path(__file__).with_name("paradigms.json")
+DICTIONARY_COLOUR = Colour.from_rgb(186, 140, 66)
+
+
+class DictionaryEntry:
+    def __init__(self, headword: str, definition: str, url: str | None = None):
+        self.headword = headword
+        self.definition = definition
+        self.url = url
+
+    def to_embed(self) -> Embed:
+        definition = self.definition
+        if len(definition) > 2000:
+            definition = definition[:1999] + "…"
+        return Embed(
+            title=self.headword,
+            description=definition,
+            url=self.url or Embed.Empty,
+            colour=DICTIONARY_COLOUR,
+        )
+
+
+class Dictionary:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            id INTEGER PRIMARY KEY,
+            headword TEXT NOT NULL,
+            key TEXT NOT NULL,
+            definition TEXT NOT NULL,
+            url TEXT
+        );
+        CREATE INDEX IF NOT EXISTS entries_key ON entries (key);
+        CREATE TABLE IF NOT EXISTS forms (
+            form TEXT NOT NULL,
+            lemma TEXT NOT NULL,
+            PRIMARY KEY (form, lemma)
+        ) WITHOUT ROWID;
+        CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5 (
+            headword, definition, content='entries', content_rowid='id'
+        );
+    """
+
+    def __init__(self, path: str, readonly: bool = True):
+        self.path = path
+        if readonly:
+            self.db = sqlite3.connect(
+                f"{Path(path).resolve().as_uri()}?mode=ro", uri=True
+            )
+        else:
+            self.db = sqlite3.connect(path)
+            self.db.executescript(self.SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    @staticmethod
+    def key(headword: str) -> str:
+        return fold(headword)
+
+    def entries(self, sql: str, params: tuple) -> List[DictionaryEntry]:
+        return [
+            DictionaryEntry(headword, definition, url)
+            for headword, definition, url in self.db.execute(sql, params)
+        ]
+
+    def headword(self, query: str, limit: int = 5) -> List[DictionaryEntry]:
+        return self.entries(
+            "SELECT headword, definition, url FROM entries WHERE key = ? "
+            "ORDER BY id LIMIT ?",
+            (self.key(query), limit),
+        )
+
+    def lemma(self, query: str, limit: int = 5) -> List[DictionaryEntry]:
+        return self.entries(
+            "SELECT headword, definition, url FROM forms "
+            "JOIN entries ON entries.key = forms.lemma WHERE forms.form = ? "
+            "ORDER BY entries.id LIMIT ?",
+            (self.key(query), limit),
+        )
+
+    def prefix(self, query: str, limit: int = 5) -> List[DictionaryEntry]:
+        key = self.key(query)
+        return self.entries(
+            "SELECT headword, definition, url FROM entries "
+            "WHERE key >= ? AND key < ? ORDER BY key, id LIMIT ?",
+            (key, key + "\U0010ffff", limit),
+        )
+
+    def search(self, query: str, limit: int = 5) -> List[DictionaryEntry]:
+        phrase = '"{0}"'.format(query.replace('"', '""'))
+        return self.entries(
+            "SELECT entries.headword, entries.definition, entries.url "
+            "FROM entries_fts JOIN entries ON entries.id = entries_fts.rowid "
+            "WHERE entries_fts MATCH ? ORDER BY rank LIMIT ?",
+            (phrase, limit),
+        )
+
+    def lookup(self, query: str, limit: int = 5) -> List[DictionaryEntry]:
+        if not self.key(query):
+            return []
+        return (
+            self.headword(query, limit)
+            or self.lemma(query, limit)
+            or self.prefix(query, limit)
+            or self.search(query, limit)
+        )
+
+    def clear(self):
+        self.db.execute("DELETE FROM entries")
+        self.db.execute("DELETE FROM forms")
+        self.db.execute("INSERT INTO entries_fts (entries_fts) VALUES ('delete-all')")
+
+    def add(self, entries: Iterable[dict]) -> int:
+        count = 0
+        for entry in entries:
+            cursor = self.db.execute(
+                "INSERT INTO entries (headword, key, definition, url) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    entry["headword"],
+                    self.key(entry["headword"]),
+                    entry["definition"],
+                    entry.get("url") or None,
+                ),
+            )
+            self.db.execute(
+                "INSERT INTO entries_fts (rowid, headword, definition) "
+                "VALUES (?, ?, ?)",
+                (cursor.lastrowid, entry["headword"], entry["definition"]),
+            )
+            count += 1
+        self.db.commit()
+        return count
+
+    def add_forms(self, paradigms: dict) -> int:
+        paradigms = {
+            "endings": {
+                fold(ending): [fold(suffix) for suffix in suffixes]
+                for ending, suffixes in paradigms["endings"].items()
+            },
+            "forms": {
+                fold(lemma): [fold(form) for form in forms]
+                for lemma, forms in paradigms["forms"].items()
+            },
+        }
+        count = 0
+        for (key,) in self.db.execute("SELECT DISTINCT key FROM entries").fetchall():
+            count += self.db.executemany(
+                "INSERT OR IGNORE INTO forms VALUES (?, ?)",
+                [(form, key) for form in inflect(key, paradigms)],
+            ).rowcount
+        self.db.commit()
+        return count
+
+    def optimize(self):
+        self.db.execute("INSERT INTO entries_fts (entries_fts) VALUES ('optimize')")
+        self.db.commit()
+        self.db.execute("VACUUM")
+
+
+def read_dump(path: str) -> Iterable[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith((".jsonl", ".ndjson")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(
+                f, delimiter="\t" if path.endswith(".tsv") else ","
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="import a Bosworth-Toller dump into a local dictionary"
+    )
+    parser.add_argument(
+        "dump",
+        help="a .jsonl, .tsv or .csv file with headword, definition and url fields",
+    )
+    parser.add_argument("path", nargs="?", default="bosworth-toller.sqlite3")
+    parser.add_argument("--paradigms", default=str(PARADIGMS))
+    args = parser.parse_args()
+    dictionary = Dictionary(args.path, readonly=False)
+    try:
+        dictionary.clear()
+        count = dictionary.add(read_dump(args.dump))
+        with open(args.paradigms, encoding="utf-8") as f:
+            forms = dictionary.add_forms(json.load(f))
+        dictionary.optimize()
+    finally:
+        dictionary.close()
+    print(f"Imported {count} entries and {forms} inflected forms into {args.path}.")
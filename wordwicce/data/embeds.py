@@ -0,0 +1,28 @@
+from discord import Embed
+from typing import List
+
+
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+FIELD_LIMIT = 25
+EMBED_LIMIT = 6000
+
+
+def truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def combine(embeds: List[Embed]) -> List[Embed]:
+    combined = []
+    for embed in embeds:
+        name = truncate(embed.title, FIELD_NAME_LIMIT)
+        link = f"\n[read more]({embed.url})" if embed.url else ""
+        value = truncate(embed.description, FIELD_VALUE_LIMIT - len(link)) + link
+        if (
+            not combined
+            or len(combined[-1].fields) >= FIELD_LIMIT
+            or len(combined[-1]) + len(name) + len(value) > EMBED_LIMIT
+        ):
+            combined.append(Embed(colour=embed.colour))
+        combined[-1].add_field(name=name, value=value, inline=False)
+    return combined
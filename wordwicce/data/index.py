@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import sqlite3
+
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from unicodedata import combining, normalize
+
+from .wiki import Wiki, WikiError, WikiExcerpt
+
+
+class WikiIndex:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            key TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            text TEXT NOT NULL,
+            url TEXT NOT NULL,
+            picture TEXT
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            name TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(self.SCHEMA)
+        self._pages = None
+
+    @property
+    def pages(self) -> dict:
+        if self._pages is None:
+            self.load()
+        return self._pages
+
+    def load(self):
+        self._pages = {
+            key: WikiExcerpt(title, text, url, picture)
+            for key, title, text, url, picture in self.db.execute(
+                "SELECT key, title, text, url, picture FROM pages"
+            )
+        }
+
+    def __len__(self) -> int:
+        if self._pages is None:
+            return self.db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return len(self._pages)
+
+    @staticmethod
+    def key(title: str) -> str:
+        return " ".join(title.replace("_", " ").split()).casefold()
+
+    def get(self, query: str) -> WikiExcerpt | None:
+        return self.pages.get(self.key(query))
+
+    def put(self, title: str, excerpt: WikiExcerpt):
+        key = self.key(title)
+        self.pages[key] = excerpt
+        self.db.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+            (key, excerpt.title, excerpt.text, excerpt.url, excerpt.picture),
+        )
+
+    def delete(self, title: str):
+        key = self.key(title)
+        self.pages.pop(key, None)
+        self.db.execute("DELETE FROM pages WHERE key = ?", (key,))
+
+    @property
+    def refreshed_at(self) -> str | None:
+        row = self.db.execute(
+            "SELECT value FROM meta WHERE name = 'refreshed_at'"
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    @refreshed_at.setter
+    def refreshed_at(self, value: str):
+        self.db.execute(
+            "INSERT OR REPLACE INTO meta VALUES ('refreshed_at', ?)", (value,)
+        )
+
+    def commit(self):
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+
+class TitleIndex:
+    CANDIDATES = 20
+
+    def __init__(self, titles=(), threshold: float = 0.75):
+        self.threshold = threshold
+        self.update(titles)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def key(title: str) -> str:
+        title = " ".join(title.replace("_", " ").split()).casefold()
+        return "".join(c for c in normalize("NFKD", title) if not combining(c))
+
+    @staticmethod
+    def trigrams(key: str) -> set:
+        padded = f"  {key} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def update(self, titles):
+        by_key = {}
+        for title in titles:
+            by_key.setdefault(self.key(title), title)
+        keys = sorted(by_key)
+        grams = {}
+        for i, key in enumerate(keys):
+            for gram in self.trigrams(key):
+                grams.setdefault(gram, []).append(i)
+        self.titles, self.keys, self.grams = by_key, keys, grams
+
+    def prefixes(self, key: str, limit: int = 2) -> list:
+        if len(key) < 3:
+            return []
+        i = bisect_left(self.keys, key)
+        return [self.titles[k] for k in self.keys[i : i + limit] if k.startswith(key)]
+
+    def prefixed(self, key: str) -> str | None:
+        titles = self.prefixes(key)
+        return titles[0] if len(titles) == 1 else None
+
+    def ranked(self, key: str) -> list:
+        shared = Counter()
+        for gram in self.trigrams(key):
+            shared.update(self.grams.get(gram, ()))
+        matcher = SequenceMatcher(b=key, autojunk=False)
+        ranked = []
+        for i, _ in shared.most_common(self.CANDIDATES):
+            matcher.set_seq1(self.keys[i])
+            ranked.append((matcher.ratio(), self.titles[self.keys[i]]))
+        ranked.sort(key=lambda candidate: -candidate[0])
+        return ranked
+
+    def resolve(self, query: str) -> str | None:
+        key = self.key(query)
+        if key in self.titles:
+            return self.titles[key]
+        for score, title in self.ranked(key)[:1]:
+            if score >= self.threshold:
+                return title
+        return self.prefixed(key)
+
+    def suggest(self, query: str, limit: int = 3) -> list:
+        key = self.key(query)
+        suggestions = self.prefixes(key, limit)
+        for score, title in self.ranked(key):
+            if len(suggestions) >= limit or score < self.threshold * 2 / 3:
+                break
+            if title not in suggestions:
+                suggestions.append(title)
+        return suggestions
+
+
+class WikiCrawler:
+    def __init__(self, wiki: Wiki, index: WikiIndex, concurrency: int = 8):
+        self.wiki = wiki
+        self.index = index
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.failed = set()
+
+    async def fetch(self, title: str):
+        async with self.semaphore:
+            try:
+                excerpt = await self.wiki.page(title)
+            except WikiError:
+                self.failed.add(title)
+                return
+        if excerpt is None:
+            self.index.delete(title)
+        else:
+            self.index.put(title, excerpt)
+
+    async def crawl(self, titles) -> int:
+        started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        pending = {title async for title in titles}
+        self.failed = set()
+        await asyncio.gather(*[self.fetch(title) for title in pending])
+        if not self.failed:
+            self.index.refreshed_at = started_at
+        self.index.commit()
+        return len(pending)
+
+    async def build(self) -> int:
+        return await self.crawl(self.wiki.all_titles())
+
+    async def refresh(self) -> int:
+        if self.index.refreshed_at is None:
+            return await self.build()
+        return await self.crawl(self.wiki.changed_titles(self.index.refreshed_at))
+
+
+async def build_index(path: str, base_url: str, concurrency: int, refresh: bool):
+    wiki = Wiki(base_url=base_url)
+    index = WikiIndex(path)
+    crawler = WikiCrawler(wiki, index, concurrency)
+    try:
+        crawled = await (crawler.refresh() if refresh else crawler.build())
+        pages = len(index)
+    finally:
+        await wiki.close()
+        index.close()
+    print(f"Crawled {crawled} pages, {pages} in {path}.")
+    if crawler.failed:
+        print(
+            f"Couldn't fetch {len(crawler.failed)} pages, "
+            "so the next refresh will retry them."
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="build the offline wiki index")
+    parser.add_argument("path", nargs="?", default="wiki-index.sqlite3")
+    parser.add_argument("--base-url", default=Wiki.BASE_URL)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--refresh", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(build_index(args.path, args.base_url, args.concurrency, args.refresh))
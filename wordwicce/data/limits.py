@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+from contextlib import asynccontextmanager
+
+
+class LimitExceeded(Exception):
+    pass
+
+
+class Cooldown:
+    def __init__(self, rate: int, per: float, maxsize: int = 10000):
+        self.rate = rate
+        self.per = per
+        self.maxsize = maxsize
+        self.buckets = {}
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def tokens(self, key, now: float) -> float:
+        tokens, updated = self.buckets.get(key, (self.rate, now))
+        return min(self.rate, tokens + (now - updated) * self.rate / self.per)
+
+    def retry_after(self, key, count: int = 1) -> float:
+        count = min(count, self.rate)
+        tokens = self.tokens(key, time.monotonic())
+        return (count - tokens) * self.per / self.rate if tokens < count else 0.0
+
+    def take(self, key, count: int = 1) -> float:
+        retry_after = self.retry_after(key, count)
+        if retry_after:
+            return retry_after
+        now = time.monotonic()
+        self.buckets[key] = (self.tokens(key, now) - min(count, self.rate), now)
+        if len(self.buckets) > self.maxsize:
+            self.prune(now)
+        return 0.0
+
+    def prune(self, now: float):
+        self.buckets = {
+            key: bucket
+            for key, bucket in self.buckets.items()
+            if now - bucket[1] < self.per
+        }
+
+
+class Limiter:
+    def __init__(self, concurrency: int = 8, max_pending: int = 64):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.max_pending = max_pending
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        if self.semaphore.locked() and self.waiting >= self.max_pending:
+            self.rejected += 1
+            raise LimitExceeded(f"{self.waiting} requests already waiting")
+        self.waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreaker:
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            return False
+        self.state = self.HALF_OPEN
+        self.opened_at = now
+        return True
+
+    def success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {"state": self.state, "failures": self.failures, "trips": self.trips}
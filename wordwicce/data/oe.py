@@ -0,0 +1,23 @@
+import re
+
+from unicodedata import combining, normalize
+
+
+FOLDS = {"ð": "þ", "th": "þ", "ae": "æ", "œ": "oe", "ƿ": "w", "-": ""}
+FOLD_PATTERN = re.compile("|".join(sorted(FOLDS, key=len, reverse=True)))
+
+
+def fold(text: str) -> str:
+    text = normalize("NFKD", " ".join(text.split()).casefold())
+    text = "".join(c for c in text if not combining(c))
+    return FOLD_PATTERN.sub(lambda match: FOLDS[match.group()], text)
+
+
+def inflect(key: str, paradigms: dict) -> set:
+    forms = set(paradigms["forms"].get(key, []))
+    for ending, suffixes in paradigms["endings"].items():
+        if key.endswith(ending) and len(key) > len(ending):
+            stem = key[: len(key) - len(ending)]
+            forms.update(stem + suffix for suffix in suffixes)
+    forms.discard(key)
+    return forms
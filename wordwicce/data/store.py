@@ -0,0 +1,143 @@
+import sqlite3
+import time
+
+from .wiki import WikiExcerpt
+
+
+class StoredExcerpt:
+    def __init__(
+        self,
+        key: str,
+        excerpt: WikiExcerpt,
+        etag: str | None,
+        last_modified: str | None,
+        fetched_at: float,
+    ):
+        self.key = key
+        self.excerpt = excerpt
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class WikiStore:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS excerpts (
+            key TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            text TEXT NOT NULL,
+            url TEXT NOT NULL,
+            picture TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 24 * 60 * 60,
+        max_age: float = 30 * 24 * 60 * 60,
+        max_entries: int = 50000,
+        access_interval: float = 60 * 60,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.access_interval = access_interval
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(self.SCHEMA)
+        self.db.commit()
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM excerpts").fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+    def get(self, key: str) -> StoredExcerpt | None:
+        row = self.db.execute(
+            "SELECT title, text, url, picture, etag, last_modified, fetched_at, "
+            "accessed_at FROM excerpts WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        title, text, url, picture, etag, last_modified, fetched_at, accessed_at = row
+        now = time.time()
+        if now - accessed_at >= self.access_interval:
+            self.db.execute(
+                "UPDATE excerpts SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.db.commit()
+        return StoredExcerpt(
+            key, WikiExcerpt(title, text, url, picture), etag, last_modified, fetched_at
+        )
+
+    def put(
+        self,
+        key: str,
+        excerpt: WikiExcerpt,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO excerpts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                excerpt.title,
+                excerpt.text,
+                excerpt.url,
+                excerpt.picture,
+                etag,
+                last_modified,
+                now,
+                now,
+            ),
+        )
+        self.db.commit()
+
+    def touch(self, key: str):
+        now = time.time()
+        self.db.execute(
+            "UPDATE excerpts SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+            (now, now, key),
+        )
+        self.db.commit()
+
+    def delete(self, key: str):
+        self.db.execute("DELETE FROM excerpts WHERE key = ?", (key,))
+        self.db.commit()
+
+    def compact(self) -> int:
+        removed = self.db.execute(
+            "DELETE FROM excerpts WHERE fetched_at < ?", (time.time() - self.max_age,)
+        ).rowcount
+        removed += self.db.execute(
+            "DELETE FROM excerpts WHERE key NOT IN "
+            "(SELECT key FROM excerpts ORDER BY accessed_at DESC LIMIT ?)",
+            (self.max_entries,),
+        ).rowcount
+        self.db.commit()
+        if removed:
+            self.db.execute("VACUUM")
+        return removed
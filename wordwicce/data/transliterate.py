@@ -0,0 +1,102 @@
+from typing import Iterable, List
+from unicodedata import normalize
+
+
+RESPELLINGS = {
+    "dh": "ð",
+    "sh": "sc",
+    "sch": "sc",
+    "ch": "c",
+    "tch": "c",
+    "ck": "c",
+    "qu": "cw",
+    "q": "c",
+    "v": "f",
+    "z": "s",
+    "ā": "a",
+    "ē": "e",
+    "ī": "i",
+    "ō": "o",
+    "ū": "u",
+    "ȳ": "y",
+    "ēa": "ea",
+    "īa": "ia",
+    "īo": "io",
+}
+
+
+class Transliterator:
+    def __init__(self, spellings: dict):
+        self.trie = {}
+        for spelling, output in spellings.items():
+            node = self.trie
+            for char in spelling:
+                node = node.setdefault(char, {})
+            node[None] = output
+
+    @classmethod
+    def from_runes(cls, runes, respellings: dict = RESPELLINGS):
+        spellings = {}
+        for rune in runes:
+            for sound in rune.sounds:
+                spellings.setdefault(normalize("NFC", sound), rune.symbol)
+        base = cls(spellings)
+        for spelling, target in respellings.items():
+            if spelling not in spellings:
+                spellings[spelling] = base.transliterate(target)
+        return cls(spellings)
+
+    def transliterate(self, text: str) -> str:
+        text = normalize("NFC", text).lower()
+        output = []
+        i = 0
+        while i < len(text):
+            node = self.trie
+            match = None
+            j = i
+            while j < len(text) and text[j] in node:
+                node = node[text[j]]
+                j += 1
+                if None in node:
+                    match = (j, node[None])
+            if match is None:
+                output.append(text[i])
+                i += 1
+            else:
+                i, symbols = match
+                output.append(symbols)
+        return "".join(output)
+
+    def transliterate_all(self, texts: Iterable[str]) -> List[str]:
+        return [self.transliterate(text) for text in texts]
+
+
+class Decoder:
+    RUNIC = range(0x16A0, 0x1700)
+    SEPARATORS = "᛫᛬᛭"
+    UNKNOWN = "?"
+
+    def __init__(self, runes):
+        self.runes = {}
+        for rune in runes:
+            self.runes.setdefault(rune.symbol, rune)
+        self.table = {codepoint: self.UNKNOWN for codepoint in self.RUNIC}
+        for symbol, rune in self.runes.items():
+            self.table[ord(symbol)] = rune.sounds[0] if rune.sounds else symbol
+        for separator in self.SEPARATORS:
+            self.table[ord(separator)] = " "
+
+    def decode(self, text: str) -> str:
+        return text.translate(self.table)
+
+    def annotate(self, text: str) -> List[str]:
+        lines = []
+        for char in text:
+            rune = self.runes.get(char)
+            if rune is not None:
+                lines.append(
+                    f"{rune.symbol} · {self.table[ord(char)]} · {rune.meaning}"
+                )
+            elif ord(char) in self.table and char not in self.SEPARATORS:
+                lines.append(f"{char} · {self.UNKNOWN}")
+        return lines
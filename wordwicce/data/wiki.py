@@ -1,19 +1,46 @@
-import requests
+import aiohttp
+import asyncio
+import codecs
+import time
 
-from bs4 import BeautifulSoup
 from discord import Colour, Embed
-from urllib.parse import quote_plus
+from html.parser import HTMLParser
+from urllib.parse import quote, quote_plus, unquote_plus
+
+from ..metrics import metrics
+from .cache import MISSING, SingleFlight, TTLCache
+from .limits import CircuitBreaker, LimitExceeded, Limiter
 
 
 WIKI_COLOUR = Colour.from_rgb(202, 77, 77)
 
 
+class WikiError(Exception):
+    pass
+
+
+class WikiBusy(WikiError):
+    pass
+
+
+class CircuitOpen(WikiError):
+    pass
+
+
 class WikiExcerpt:
-    def __init__(self, title: str, text: str, url: str, picture: str | None = None):
+    def __init__(
+        self,
+        title: str,
+        text: str,
+        url: str,
+        picture: str | None = None,
+        stale: bool = False,
+    ):
         self.title = title
         self.text = text
         self.url = url
         self.picture = picture
+        self.stale = stale
 
     def to_embed(self) -> Embed:
         embed = Embed(
@@ -21,27 +48,278 @@ class WikiExcerpt:
         )
         if self.picture:
             embed.set_image(url=self.picture)
+        if self.stale:
+            embed.set_footer(text="this excerpt may be out of date.")
         return embed
 
 
+class OpenGraphParser(HTMLParser):
+    PROPERTIES = ("og:title", "og:description", "og:url", "og:image")
+
+    def __init__(self):
+        super().__init__()
+        self.properties = {}
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.done = True
+        elif tag == "meta":
+            attrs = dict(attrs)
+            prop = attrs.get("property")
+            if prop in self.PROPERTIES and prop not in self.properties:
+                self.properties[prop] = attrs.get("content")
+                self.done = len(self.properties) == len(self.PROPERTIES)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+
+    def excerpt(self) -> WikiExcerpt | None:
+        title = self.properties.get("og:title")
+        text = self.properties.get("og:description")
+        url = self.properties.get("og:url")
+        if text is None or title is None or url is None:
+            return None
+        return WikiExcerpt(title, text, url, self.properties.get("og:image"))
+
+
 class Wiki:
     BASE_URL = "https://anglosaxonheathenry.wiki"
+    API_PATH = "/api.php"
+    CHUNK_SIZE = 8192
+
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        pool_size: int = 20,
+        cache: TTLCache | None = None,
+        store=None,
+        index=None,
+        titles=None,
+        base_url: str | None = None,
+        limiter: Limiter | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self.pool_size = pool_size
+        self._session = None
+        self.cache = cache if cache is not None else TTLCache()
+        self.inflight = SingleFlight()
+        self.store = store
+        self.index = index
+        self.titles = titles
+        self.limiter = limiter
+        self.breaker = breaker
+        self.revalidating = {}
 
-    def normalize_query(self, query: str) -> str:
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=self.timeout,
+            )
+        return self._session
+
+    async def close(self):
+        for task in list(self.revalidating.values()):
+            task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self.store is not None:
+            self.store.close()
+        if self.index is not None:
+            self.index.close()
+
+    def normalize_query(self, query: str) -> str | None:
+        if self.titles:
+            title = self.titles.resolve(query)
+            return self.title_path(title) if title is not None else None
         return quote_plus(query.capitalize())
 
-    def request(self, query: str) -> str | None:
-        query = self.normalize_query(query)
-        r = requests.get(f"{self.BASE_URL}/{query}")
-        if r.status_code != 200:
+    def title_path(self, title: str) -> str:
+        return quote(title.replace(" ", "_"))
+
+    def suggest(self, query: str) -> list:
+        return self.titles.suggest(query) if self.titles else []
+
+    async def api(self, **params) -> dict:
+        params = {"format": "json", "formatversion": "2", **params}
+        try:
+            async with self.session.get(
+                f"{self.BASE_URL}{self.API_PATH}", params=params
+            ) as r:
+                r.raise_for_status()
+                return await r.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            metrics.increment("wiki.errors")
+            raise WikiError(f"couldn't query {self.BASE_URL}{self.API_PATH}") from e
+
+    async def query_list(self, name: str, **params):
+        params = {"list": name, **params}
+        while True:
+            data = await self.api(action="query", **params)
+            for item in data["query"][name]:
+                yield item["title"]
+            if "continue" not in data:
+                return
+            params.update(data["continue"])
+
+    def all_titles(self):
+        return self.query_list("allpages", apnamespace=0, aplimit="max")
+
+    def changed_titles(self, since: str):
+        return self.query_list(
+            "recentchanges",
+            rcnamespace=0,
+            rcend=since,
+            rcprop="title",
+            rctype="edit|new|log",
+            rclimit="max",
+        )
+
+    async def page(self, title: str) -> WikiExcerpt | None:
+        return await self.request_path(self.title_path(title))
+
+    async def request(self, query: str, stored=None) -> WikiExcerpt | None:
+        path = self.normalize_query(query)
+        if path is None:
             return None
-        return r.text
+        return await self.request_path(path, stored)
+
+    async def request_path(self, path: str, stored=None) -> WikiExcerpt | None:
+        headers = stored.headers if stored is not None else {}
+        started = time.perf_counter()
+        try:
+            async with self.session.get(
+                f"{self.BASE_URL}/{path}", headers=headers
+            ) as r:
+                metrics.observe("wiki.http", time.perf_counter() - started)
+                if r.status == 304 and stored is not None:
+                    self.store.touch(path)
+                    return stored.excerpt
+                if r.status >= 500:
+                    metrics.increment("wiki.errors")
+                    raise WikiError(f"{self.BASE_URL} answered {r.status}")
+                if r.status != 200:
+                    return None
+                with metrics.time("wiki.parse"):
+                    excerpt = await self.stream(r)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            metrics.increment("wiki.errors")
+            raise WikiError(f"couldn't reach {self.BASE_URL}") from e
+        if self.store is not None:
+            if excerpt is not None:
+                self.store.put(
+                    path,
+                    excerpt,
+                    r.headers.get("ETag"),
+                    r.headers.get("Last-Modified"),
+                )
+            elif stored is not None:
+                self.store.delete(path)
+        return excerpt
 
-    def search(self, query: str) -> WikiExcerpt | None:
-        response = self.request(query)
-        if not response:
+    async def stream(self, response: aiohttp.ClientResponse) -> WikiExcerpt | None:
+        try:
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")
+        decoder = decoder("replace")
+        parser = OpenGraphParser()
+        chunks = []
+        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+            chunks.append(decoder.decode(chunk))
+            if parser is None:
+                continue
+            try:
+                parser.feed(chunks[-1])
+            except AssertionError:
+                parser = None
+                continue
+            if parser.done:
+                return parser.excerpt()
+        chunks.append(decoder.decode(b"", final=True))
+        return self.parse("".join(chunks))
+
+    async def search(self, query: str) -> WikiExcerpt | None:
+        key = self.normalize_query(query)
+        if key is None:
             return None
+        if self.index is not None:
+            excerpt = self.index.get(unquote_plus(key))
+            if excerpt is not None:
+                return excerpt
+        excerpt = self.cache.get(key)
+        if excerpt is MISSING:
+            excerpt = await self.inflight.do(key, lambda: self.fetch(key))
+        return excerpt
+
+    async def fetch(self, key: str) -> WikiExcerpt | None:
+        stored = self.store.get(key) if self.store is not None else None
+        if stored is not None and stored.age < self.store.ttl:
+            excerpt = stored.excerpt
+        elif stored is not None:
+            self.revalidate(key, stored)
+            excerpt = stored.excerpt
+            return WikiExcerpt(
+                excerpt.title, excerpt.text, excerpt.url, excerpt.picture, stale=True
+            )
+        else:
+            excerpt = await self.refresh(key)
+        self.cache.set(key, excerpt)
+        return excerpt
+
+    async def refresh(self, key: str, stored=None) -> WikiExcerpt | None:
+        if self.breaker is not None and not self.breaker.allow():
+            metrics.increment("wiki.short_circuited")
+            raise CircuitOpen(f"{self.BASE_URL} is failing, not asking it")
+        try:
+            if self.limiter is None:
+                excerpt = await self.request_path(key, stored)
+            else:
+                try:
+                    async with self.limiter.slot():
+                        excerpt = await self.request_path(key, stored)
+                except LimitExceeded as e:
+                    metrics.increment("wiki.rejected")
+                    raise WikiBusy("too many wiki requests waiting") from e
+        except WikiBusy:
+            raise
+        except BaseException:
+            if self.breaker is not None:
+                self.breaker.failure()
+            raise
+        if self.breaker is not None:
+            self.breaker.success()
+        return excerpt
+
+    def revalidate(self, key: str, stored):
+        if key in self.revalidating:
+            return
+        task = asyncio.ensure_future(self.refresh(key, stored))
+        self.revalidating[key] = task
+        task.add_done_callback(lambda task: self.revalidated(key, task))
+
+    def revalidated(self, key: str, task: asyncio.Task):
+        self.revalidating.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            metrics.increment("wiki.revalidate.failed")
+            return
+        self.cache.set(key, task.result())
+
+    def parse(self, response: str) -> WikiExcerpt | None:
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(response, "html.parser")
+        if soup.head is None:
+            return None
         title = soup.head.find("meta", property="og:title")
         text = soup.head.find("meta", property="og:description")
         url = soup.head.find("meta", property="og:url")
@@ -54,3 +332,72 @@ class Wiki:
             url.attrs["content"],
             picture.attrs["content"] if picture is not None else None,
         )
+
+
+class WikiAPI(Wiki):
+    EXTRACT_CHARS = 500
+
+    def normalize_query(self, query: str) -> str | None:
+        if self.titles:
+            return super().normalize_query(query)
+        return quote_plus(" ".join(query.split()))
+
+    def candidates(self, query: str) -> list:
+        query = " ".join(query.replace("_", " ").split())
+        return list(
+            dict.fromkeys(
+                [
+                    query,
+                    query.capitalize(),
+                    query.title(),
+                    query[:1].upper() + query[1:],
+                ]
+            )
+        )
+
+    async def request_path(self, path: str, stored=None) -> WikiExcerpt | None:
+        candidates = self.candidates(unquote_plus(path))
+        with metrics.time("wiki.http"):
+            data = await self.api(
+                action="query",
+                titles="|".join(candidates),
+                redirects=1,
+                prop="extracts|pageimages|info",
+                exintro=1,
+                explaintext=1,
+                exchars=self.EXTRACT_CHARS,
+                piprop="original",
+                inprop="url",
+            )
+        with metrics.time("wiki.parse"):
+            excerpt = self.parse_query(candidates, data.get("query", {}))
+        if self.store is not None:
+            if excerpt is not None:
+                self.store.put(path, excerpt)
+            elif stored is not None:
+                self.store.delete(path)
+        return excerpt
+
+    def parse_query(self, candidates: list, query: dict) -> WikiExcerpt | None:
+        renames = {
+            rename["from"]: rename["to"]
+            for rename in query.get("normalized", []) + query.get("redirects", [])
+        }
+        pages = {
+            page["title"]: page
+            for page in query.get("pages", [])
+            if "missing" not in page and "invalid" not in page
+        }
+        for candidate in candidates:
+            title = candidate
+            for _ in range(3):
+                title = renames.get(title, title)
+            page = pages.get(title)
+            if page is not None and page.get("extract"):
+                return WikiExcerpt(
+                    page["title"],
+                    page["extract"],
+                    page["fullurl"],
+                    page.get("original", {}).get("source"),
+                )
+        return None
@@ -0,0 +1,133 @@
+import os
+import resource
+import time
+
+from bisect import bisect_left
+from contextlib import contextmanager
+
+
+BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.buckets[-1]
+
+
+class Metrics:
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+
+    def observe(self, name: str, seconds: float):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def increment(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name: str, read):
+        self.gauges[name] = read
+
+    def read_gauges(self) -> dict:
+        values = {}
+        for name, read in self.gauges.items():
+            value = read()
+            if isinstance(value, dict):
+                values.update({f"{name}.{key}": v for key, v in value.items()})
+            else:
+                values[name] = value
+        return values
+
+    def summary(self) -> str:
+        lines = []
+        for name, h in sorted(self.histograms.items()):
+            lines.append(
+                f"{name}: n={h.count} avg={h.sum / h.count * 1000:.1f}ms "
+                f"p50≤{h.percentile(0.5) * 1000:g}ms "
+                f"p95≤{h.percentile(0.95) * 1000:g}ms "
+                f"p99≤{h.percentile(0.99) * 1000:g}ms"
+            )
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name}: {value}")
+        for name, value in sorted(self.read_gauges().items()):
+            lines.append(f"{name}: {value}")
+        return "\n".join(lines)
+
+    def render(self) -> str:
+        lines = []
+        for name, h in sorted(self.histograms.items()):
+            metric = "wordwicce_" + name.replace(".", "_") + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, count in zip(h.buckets, h.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'{metric}_bucket{{le="{le}"}} {cumulative}')
+            lines.append(f"{metric}_sum {h.sum}")
+            lines.append(f"{metric}_count {h.count}")
+        for name, value in sorted(self.counters.items()):
+            metric = "wordwicce_" + name.replace(".", "_") + "_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, value in sorted(self.read_gauges().items()):
+            metric = "wordwicce_" + name.replace(".", "_")
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def resident_memory() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+metrics = Metrics()
@@ -0,0 +1,6 @@
+from . import base, local
+
+
+for name in dir(base):
+    if name.isupper() and not hasattr(local, name):
+        setattr(local, name, getattr(base, name))
@@ -0,0 +1,60 @@
+WIKI_BASE_URL = "https://anglosaxonheathenry.wiki"
+WIKI_CONNECT_TIMEOUT = 5.0
+WIKI_READ_TIMEOUT = 10.0
+WIKI_POOL_SIZE = 20
+
+WIKI_CONCURRENCY = 8
+WIKI_MAX_PENDING = 64
+WIKI_GUILD_COOLDOWN = (20, 60)
+WIKI_USER_COOLDOWN = (5, 30)
+WIKI_BATCH_SIZE = 5
+WIKI_BATCH_CONCURRENCY = 3
+WIKI_BREAKER_THRESHOLD = 5
+WIKI_BREAKER_RESET = 30.0
+
+WIKI_CACHE_SIZE = 1024
+WIKI_CACHE_TTL = 6 * 60 * 60
+WIKI_CACHE_NEGATIVE_TTL = 10 * 60
+
+WIKI_STORE_PATH = "wiki.sqlite3"
+WIKI_STORE_TTL = 24 * 60 * 60
+WIKI_STORE_MAX_AGE = 30 * 24 * 60 * 60
+WIKI_STORE_MAX_ENTRIES = 50000
+WIKI_STORE_ACCESS_INTERVAL = 60 * 60
+
+WIKI_INDEX_PATH = "wiki-index.sqlite3"
+WIKI_INDEX_CONCURRENCY = 4
+
+WIKI_TITLE_MATCHING = True
+WIKI_TITLE_THRESHOLD = 0.75
+
+WIKI_BACKEND = "html"
+
+RUNE_MAX_DISTANCE = 2
+RUNE_ROWS = None
+RUNE_BATCH_SIZE = 10
+RUNE_WARM_UP = True
+RUNE_PAGE_SIZE = 20
+RUNE_PAGE_TIMEOUT = 120.0
+RUNE_PAGE_BACK = "◀️"
+RUNE_PAGE_NEXT = "▶️"
+
+DICTIONARY_PATH = "bosworth-toller.sqlite3"
+
+EXTENSIONS = ["admin", "dictionary", "misc", "rune", "stats", "wiki"]
+
+LEAN_GATEWAY = True
+LEAN_INTENTS = {
+    "guilds": True,
+    "guild_messages": True,
+    "dm_messages": True,
+    "guild_reactions": True,
+    "dm_reactions": True,
+}
+
+SHARD_COUNT = None
+CLUSTER_SIZE = None
+CLUSTER_STAGGER = 5.0
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = None